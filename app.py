@@ -1,18 +1,9 @@
 import os
 import sys
 
-import redis
 from dotenv import load_dotenv
-from flask import Flask
-from flask_session import Session
-from werkzeug.middleware.proxy_fix import ProxyFix
-
-# Import Routes
-from routes import base_site, auth, admin, register_middlewares
 
 from lib.logging_module import CustomLogger
-from lib.mysql_module import MySQLDatabase
-from lib.redis_module import RedisCache
 
 app_name = "icad_dispatch"
 __version__ = "1.0"
@@ -35,75 +26,111 @@ load_dotenv()
 main_logger = CustomLogger(os.getenv('LOG_LEVEL', 1), f'{app_name}',
                                 os.path.join(log_path, log_file_name), show_threads=True).logger
 
-try:
-    db = MySQLDatabase()
-    db._init_db()
-    main_logger.info("MySQL Database connected successfully.")
-except Exception as e:
-    main_logger.error(f'Error while <<connecting>> to the <<MySQL Database:>> {e}')
-    sys.exit(1)
 
-try:
-    rd = RedisCache()
-    main_logger.info("Redis Pool Connection Pool connected successfully.")
-except Exception as e:
-    main_logger.error(f'Error while <<connecting>> to the <<Redis Cache:>> {e}')
-    sys.exit(1)
+def create_app():
+    """
+    Create and configure the Flask application.
+
+    Heavier dependencies are imported here so they are only loaded when the app is built.
+
+    Returns:
+        Flask: Configured Flask application.
+    """
+    import redis
+    from flask import Flask
+    from flask_session import Session
+    from werkzeug.middleware.proxy_fix import ProxyFix
 
-app = Flask(__name__)
+    from lib.config_module import load_config_data
+    from lib.mysql_module import MySQLDatabase
+    from lib.redis_module import RedisCache
+    from lib.redis_pools import make_pool
 
-app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_port=1, x_prefix=1)
+    # Import Routes
+    from routes import base_site, auth, admin, register_middlewares
 
-# Load or create secret key
-if not os.getenv('SECRET_KEY'):
     try:
-        with open(os.path.join(root_path + '/etc', 'secret_key'), 'rb') as f:
-            app.config['SECRET_KEY'] = f.read()
-    except FileNotFoundError:
-        secret_key = os.urandom(24)
-        with open(os.path.join(root_path + '/etc', 'secret_key'), 'wb') as f:
-            f.write(secret_key)
-            app.config['SECRET_KEY'] = secret_key
-else:
-    app.config['SECRET_KEY'] = os.getenv('SECRET_KEY')
-
-app.config['logger'] = main_logger
-app.config['base_url'] = os.getenv('BASE_URL')
-app.config['db'] = db
-app.config['rd'] = rd
-
-# Session Configuration
-app.config['SESSION_TYPE'] = 'redis'
-app.config['SESSION_PERMANENT'] = False
-app.config['SESSION_USE_SIGNER'] = True
-app.config['SESSION_KEY_PREFIX'] = 'icad_dispatch_session:'
-app.config['SESSION_REDIS'] = redis.StrictRedis(host=os.getenv("REDIS_HOST"),
-                                                password=os.getenv("REDIS_PASSWORD"),
-                                                port=os.getenv("REDIS_PORT"), db=os.getenv("REDIS_SESSION_DB"))
-
-# Cookie Configuration
-app.config['SESSION_COOKIE_SECURE'] = os.getenv("SESSION_COOKIE_SECURE")
-app.config['SESSION_COOKIE_HTTPONLY'] = True
-app.config['SESSION_COOKIE_DOMAIN'] = os.getenv("SESSION_COOKIE_DOMAIN")
-app.config['SESSION_COOKIE_NAME'] = os.getenv("SESSION_COOKIE_NAME")
-app.config['SESSION_COOKIE_PATH'] = os.getenv("SESSION_COOKIE_PATH")
-app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
-
-# Initializing the session
-sess = Session()
-sess.init_app(app)
-
-# Register base site /
-app.register_blueprint(base_site, url_prefix='/')
-
-# Register auth routes /auth
-app.register_blueprint(auth, url_prefix='/auth')
-
-# Register Admin Routes /admin
-app.register_blueprint(admin, url_prefix='/admin')
-
-# Register Middleware
-register_middlewares(app)
+        config_data = load_config_data()
+        db = MySQLDatabase(config_data)
+        db._init_db()
+        main_logger.info("MySQL Database connected successfully.")
+    except Exception as e:
+        main_logger.error(f'Error while <<connecting>> to the <<MySQL Database:>> {e}')
+        sys.exit(1)
+
+    try:
+        rd = RedisCache()
+        main_logger.info("Redis Pool Connection Pool connected successfully.")
+    except Exception as e:
+        main_logger.error(f'Error while <<connecting>> to the <<Redis Cache:>> {e}')
+        sys.exit(1)
+
+    app = Flask(__name__)
+
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_port=1, x_prefix=1)
+
+    # Load or create secret key
+    if not os.getenv('SECRET_KEY'):
+        try:
+            with open(os.path.join(root_path + '/etc', 'secret_key'), 'rb') as f:
+                app.config['SECRET_KEY'] = f.read()
+        except FileNotFoundError:
+            secret_key = os.urandom(24)
+            with open(os.path.join(root_path + '/etc', 'secret_key'), 'wb') as f:
+                f.write(secret_key)
+                app.config['SECRET_KEY'] = secret_key
+    else:
+        app.config['SECRET_KEY'] = os.getenv('SECRET_KEY')
+
+    app.config['logger'] = main_logger
+    app.config['base_url'] = os.getenv('BASE_URL')
+    app.config['db'] = db
+    app.config['rd'] = rd
+
+    # Static files are sent with Cache-Control: public, max-age
+    app.config['SEND_FILE_MAX_AGE_DEFAULT'] = int(os.getenv("STATIC_MAX_AGE", 3600))
+
+    # Session Configuration
+    app.config['SESSION_TYPE'] = 'redis'
+    app.config['SESSION_PERMANENT'] = False
+    app.config['SESSION_USE_SIGNER'] = True
+    app.config['SESSION_KEY_PREFIX'] = 'icad_dispatch_session:'
+    redis_config = config_data["redis"]
+    app.config['SESSION_REDIS'] = redis.StrictRedis(connection_pool=make_pool(
+        redis_config["host"],
+        redis_config["port"],
+        redis_config["password"],
+        redis_config["session_db"],
+        redis_config["max_connections"]
+    ))
+
+    # Cookie Configuration
+    app.config['SESSION_COOKIE_SECURE'] = os.getenv("SESSION_COOKIE_SECURE")
+    app.config['SESSION_COOKIE_HTTPONLY'] = True
+    app.config['SESSION_COOKIE_DOMAIN'] = os.getenv("SESSION_COOKIE_DOMAIN")
+    app.config['SESSION_COOKIE_NAME'] = os.getenv("SESSION_COOKIE_NAME")
+    app.config['SESSION_COOKIE_PATH'] = os.getenv("SESSION_COOKIE_PATH")
+    app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
+
+    # Initializing the session
+    sess = Session()
+    sess.init_app(app)
+
+    # Register base site /
+    app.register_blueprint(base_site, url_prefix='/')
+
+    # Register auth routes /auth
+    app.register_blueprint(auth, url_prefix='/auth')
+
+    # Register Admin Routes /admin
+    app.register_blueprint(admin, url_prefix='/admin')
+
+    # Register Middleware
+    register_middlewares(app)
+
+    return app
+
 
 if __name__ == '__main__':
+    app = create_app()
     app.run(host='0.0.0.0', port=8099, debug=True)
\ No newline at end of file
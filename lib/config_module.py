@@ -4,13 +4,69 @@
 """
 Author: Ian Carey
 Date: 2025-1-17
-Description: This script loads configuration data from MySQL Database
+Description: This script loads configuration data from the environment and MySQL Database
 """
 
 import logging
+import os
+
+import redis
 
 module_logger = logging.getLogger('icad_dispatch.config')
 
+# Process local cache of get_config results, dropped whenever set_config bumps the shared version key
+_CONFIG_VERSION_KEY = "app_config:ver"
+_config_cache: dict = {}
+_config_version = None
+
+
+def load_config_data():
+    """
+    Load and validate the environment configuration once at startup.
+
+    Returns:
+        dict: Configuration data with `mysql` and `redis` sections.
+
+    Raises:
+        ValueError: If any required configuration data is missing or invalid.
+    """
+
+    # Validate MySQL configuration
+    required_mysql_keys = ["MYSQL_HOST", "MYSQL_USER", "MYSQL_PASSWORD", "MYSQL_DATABASE", "MYSQL_PORT"]
+    for key in required_mysql_keys:
+        if not os.getenv(key):
+            raise ValueError(f"Missing required MySQL environment variable: '{key}'")
+
+    # Validate Redis configuration
+    required_redis_keys = ["REDIS_HOST", "REDIS_PORT", "REDIS_PASSWORD", "REDIS_MYSQL_CACHE_DB"]
+    for key in required_redis_keys:
+        if not os.getenv(key):
+            raise ValueError(f"Missing required Redis environment variable: '{key}'")
+
+    try:
+        return {
+            "mysql": {
+                "host": os.getenv("MYSQL_HOST"),
+                "user": os.getenv("MYSQL_USER"),
+                "password": os.getenv("MYSQL_PASSWORD"),
+                "database": os.getenv("MYSQL_DATABASE"),
+                "port": int(os.getenv("MYSQL_PORT")),
+                "pool_size": int(os.getenv("MYSQL_POOL_SIZE", 5)),
+                "pool_timeout": float(os.getenv("MYSQL_POOL_TIMEOUT", 5))
+            },
+            "redis": {
+                "host": os.getenv("REDIS_HOST"),
+                "port": int(os.getenv("REDIS_PORT")),
+                "password": os.getenv("REDIS_PASSWORD"),
+                "max_connections": int(os.getenv("REDIS_MAX_CONN", 50)),
+                "mysql_cache_db": int(os.getenv("REDIS_MYSQL_CACHE_DB")),
+                "session_db": int(os.getenv("REDIS_SESSION_DB", 0))
+            }
+        }
+    except ValueError as e:
+        raise ValueError(f"Invalid number in environment configuration: {e}")
+
+
 def init_config(db):
     default_config = [
     ]
@@ -26,6 +82,10 @@ def get_config(db, config_key=None):
     Returns:
         dict: Configuration settings as a dictionary where keys are `config_key` and values are `config_value`.
     """
+    _check_config_version(db)
+    if config_key in _config_cache:
+        return dict(_config_cache[config_key])
+
     base_query = """
     SELECT 
       ac.config_key,
@@ -48,8 +108,30 @@ def get_config(db, config_key=None):
     # Convert result to a dictionary
     result = config_result.get('result', [])
     config_dict = {row['config_key']: row['config_value'] for row in result}
+    _config_cache[config_key] = config_dict
+
+    return dict(config_dict)
+
+
+def _check_config_version(db):
+    """
+    Clear the local config cache if another process has changed the config since it was filled.
 
-    return config_dict
+    Args:
+        db: Database connection object.
+    """
+    global _config_version
+    try:
+        version = db.redis_client.get(_CONFIG_VERSION_KEY)
+    except redis.RedisError as e:
+        module_logger.error(f"Failed to check config version: {e}")
+        _config_cache.clear()
+        _config_version = None
+        return
+
+    if version != _config_version:
+        _config_cache.clear()
+        _config_version = version
 
 def set_config(db, config_key, config_value, description=None):
     """
@@ -76,7 +158,7 @@ def set_config(db, config_key, config_value, description=None):
         WHERE config_key = %s
         """
         params = (config_value, description, config_key)
-        return db.execute_query(update_query, params)
+        result = db.execute_commit(update_query, params)
     else:
         # Key doesn't exist, insert it
         insert_query = """
@@ -84,4 +166,13 @@ def set_config(db, config_key, config_value, description=None):
         VALUES (%s, %s, %s)
         """
         params = (config_key, config_value, description)
-        return db.execute_query(insert_query, params)
\ No newline at end of file
+        result = db.execute_commit(insert_query, params)
+
+    if result.get('success'):
+        _config_cache.clear()
+        try:
+            db.redis_client.incr(_CONFIG_VERSION_KEY)
+        except redis.RedisError as e:
+            module_logger.error(f"Failed to bump config version: {e}")
+
+    return result
@@ -11,7 +11,9 @@ Usage: In main script import and start MySQLDatabase
 
 Requirements:
 - Python 3.12+
+- lz4~=4.3.3
 - mysql-connector-python~=9.1.0
+- orjson~=3.10.14
 - redis~=5.2.1
 
 """
@@ -21,69 +23,146 @@ import hashlib
 import json
 import logging
 import math
-import os
 import re
 import time
 from decimal import Decimal
+from functools import lru_cache
 
 import bcrypt
+import lz4.frame
 import mysql.connector
+import mysql.connector.pooling
+import orjson
 import redis
 
+from lib.redis_pools import make_pool
+
 module_logger = logging.getLogger('icad_dispatch.mysql')
 
+# Matches table names following FROM, UPDATE, INSERT INTO and DELETE FROM clauses
+_TABLE_RE = re.compile(r'(?:FROM|UPDATE|INSERT\s+INTO|DELETE\s+FROM)\s+`?(\w+)`?', re.IGNORECASE)
+
+# Matches server state lookups and non-deterministic functions whose results should never be cached
+_NON_CACHEABLE = re.compile(r'^\s*(SHOW|EXPLAIN|SELECT\s+VERSION|SELECT\s+LAST_INSERT_ID)|NOW\(\)|CURRENT_TIMESTAMP|RAND\(\)',
+                            re.IGNORECASE)
+
+# Cached query results are prefixed with a format tag, payloads over the threshold are LZ4 compressed
+_CACHE_TAG_JSON = b"\x00"
+_CACHE_TAG_LZ4 = b"\x01"
+_COMPRESS_MIN_BYTES = 1024
+
+# Times a table invalidation retries when its set changes between the read and the UNLINK
+_INVALIDATE_ATTEMPTS = 5
+
+
+def _identity(val):
+    return val
+
+
+# Converters for exact value types, subclasses and containers fall back to isinstance checks
+_CONVERTERS = {
+    str: _identity,
+    bool: _identity,
+    int: _identity,
+    float: _identity,
+    type(None): _identity,
+    Decimal: float,
+    datetime.datetime: datetime.datetime.timestamp,
+    datetime.date: datetime.date.isoformat,
+    datetime.time: datetime.time.isoformat,
+    datetime.timedelta: datetime.timedelta.total_seconds
+}
+
+
+@lru_cache(maxsize=1024)
+def _query_meta(query):
+    """
+    Get the parameter independent metadata for a query string.
+
+    Args:
+        query (str): SQL query string.
+
+    Returns:
+        tuple: Unique table names in the query and the cache key hash prefix.
+    """
+    tables = tuple({match.group(1) for match in _TABLE_RE.finditer(query)})
+    return tables, query.encode() + b"|"
+
+
+def _params_key(params):
+    """
+    Get a deterministic byte representation of query parameters for hashing.
+
+    Args:
+        params (tuple or dict): Query parameters.
+
+    Returns:
+        bytes: Representation that is equal for equal parameters regardless of dict order.
+    """
+    if isinstance(params, dict):
+        params = sorted(params.items())
+    return repr(params).encode()
+
+
 class MySQLDatabase:
     """
-       Represents a MySQL database with on-demand connection creation and Redis caching.
+       Represents a MySQL database with pooled connections and Redis caching.
 
        Attributes:
            dbconfig (dict): Configuration data for the MySQL connection.
+           pool (mysql.connector.pooling.MySQLConnectionPool): Pool of MySQL connections.
+           pool_timeout (float): Seconds to wait for a free pooled connection.
            redis_host (str): Hostname for the Redis server.
            redis_port (int): Port for the Redis server.
            redis_password (str): Password for the Redis server.
            redis_client (redis.StrictRedis): Redis client instance for caching.
     """
 
-    def __init__(self):
+    def __init__(self, config_data):
         """
         Initialize the MySQLDatabase with MySQL and Redis configuration data.
 
-        Raises:
-            ValueError: If any required configuration data is missing.
+        Args:
+            config_data (dict): Configuration data returned by `load_config_data()`.
         """
 
-        # Validate MySQL configuration
-        required_mysql_keys = ["MYSQL_HOST", "MYSQL_USER", "MYSQL_PASSWORD", "MYSQL_DATABASE", "MYSQL_PORT"]
-        for key in required_mysql_keys:
-            if not os.getenv(key):
-                raise ValueError(f"Missing required MySQL environment variable: '{key}'")
-
-        # Validate Redis configuration
-        required_redis_keys = ["REDIS_HOST", "REDIS_PORT", "REDIS_PASSWORD", "REDIS_MYSQL_CACHE_DB"]
-        for key in required_redis_keys:
-            if not os.getenv(key):
-                raise ValueError(f"Missing required Redis environment variable: '{key}'")
+        mysql_config = config_data["mysql"]
+        redis_config = config_data["redis"]
 
         # MySQL configuration
         self.dbconfig = {
-            "host": os.getenv("MYSQL_HOST"),
-            "user": os.getenv("MYSQL_USER"),
-            "password": os.getenv("MYSQL_PASSWORD"),
-            "database": os.getenv("MYSQL_DATABASE"),
-            "port": int(os.getenv("MYSQL_PORT"))
+            "host": mysql_config["host"],
+            "user": mysql_config["user"],
+            "password": mysql_config["password"],
+            "database": mysql_config["database"],
+            "port": mysql_config["port"]
         }
 
-        # Redis configuration
-        self.redis_host = os.getenv("REDIS_HOST")
-        self.redis_port = int(os.getenv("REDIS_PORT"))
-        self.redis_password = os.getenv("REDIS_PASSWORD")
-        self.redis_client = redis.StrictRedis(
-            host=self.redis_host,
-            port=self.redis_port,
-            password=self.redis_password,
-            db=int(os.getenv("REDIS_MYSQL_CACHE_DB"))
+        # The connector silently falls back to pure Python protocol parsing without its C extension
+        if not mysql.connector.HAVE_CEXT:
+            module_logger.warning("<<MySQL>> C extension is not available, falling back to the slower pure Python connector.")
+
+        # Create the connection pool, size it to the worker's threads, server max_connections must cover every worker
+        self.pool_timeout = mysql_config["pool_timeout"]
+        self.pool = mysql.connector.pooling.MySQLConnectionPool(
+            pool_name="icad",
+            pool_size=mysql_config["pool_size"],
+            pool_reset_session=True,
+            **self.dbconfig
         )
 
+        # Redis configuration
+        self.redis_host = redis_config["host"]
+        self.redis_port = redis_config["port"]
+        self.redis_password = redis_config["password"]
+        self.redis_client = redis.StrictRedis(connection_pool=make_pool(
+            self.redis_host,
+            self.redis_port,
+            self.redis_password,
+            redis_config["mysql_cache_db"],
+            redis_config["max_connections"]
+        ))
+
     def _init_db(self):
 
         query = "SELECT * FROM users WHERE user_username = %s"
@@ -125,16 +204,65 @@ class MySQLDatabase:
         try:
             module_logger.debug(f"Caching query into redis")
 
-            serialized_result = json.dumps(result, default=self._convert_value)
-            self.redis_client.setex(key, ttl, serialized_result)
+            try:
+                serialized_result = self._serialize_cached_result(result)
+            except (TypeError, ValueError) as e:
+                # Values like BLOB bytes have no JSON form, return the rows uncached
+                module_logger.warning(f"Skipping cache for unserializable query result: {e}")
+                return
 
             param_hash = self._generate_param_hash(params)
+
+            # Send the result and table associations in a single round trip. Each table keeps a per params set
+            # and an index set holding every cached key and per params set name, so a whole table is cleared
+            # from the index alone. NX then GT keeps each set alive as long as its longest lived entry.
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.setex(key, ttl, serialized_result)
             for table in tables:
-                table_key = f"table_cache:{table}:{param_hash}"
-                self.redis_client.sadd(table_key, key)
+                param_key = f"table_cache:{table}:{param_hash}"
+                index_key = f"table_cache:{table}"
+                pipe.sadd(param_key, key)
+                pipe.sadd(index_key, key, param_key)
+                for set_key in (param_key, index_key):
+                    pipe.expire(set_key, ttl, nx=True)
+                    pipe.expire(set_key, ttl, gt=True)
+            pipe.execute()
         except redis.RedisError as e:
             module_logger.error(f"Failed to cache query result: {e}")
 
+    def _serialize_cached_result(self, result):
+        """
+        Serialize a query result for Redis, compressing it with LZ4 when it is large.
+
+        Args:
+            result (list): Query result to serialize.
+
+        Returns:
+            bytes: Format tag byte followed by the JSON or LZ4 compressed JSON payload.
+        """
+        payload = orjson.dumps(result, default=self._convert_value, option=orjson.OPT_PASSTHROUGH_DATETIME)
+        if len(payload) > _COMPRESS_MIN_BYTES:
+            return _CACHE_TAG_LZ4 + lz4.frame.compress(payload)
+        return _CACHE_TAG_JSON + payload
+
+    def _deserialize_cached_result(self, cached_result):
+        """
+        Deserialize a query result stored by `_serialize_cached_result`.
+
+        Args:
+            cached_result (bytes): Cached value from Redis.
+
+        Returns:
+            list: Query result.
+        """
+        tag, payload = cached_result[:1], cached_result[1:]
+        if tag == _CACHE_TAG_LZ4:
+            return orjson.loads(lz4.frame.decompress(payload))
+        if tag == _CACHE_TAG_JSON:
+            return orjson.loads(payload)
+        # Untagged entries written before compression was added
+        return orjson.loads(cached_result)
+
     def _generate_param_hash(self, params):
         """
         Generate a unique hash for query parameters.
@@ -143,10 +271,9 @@ class MySQLDatabase:
             params (dict): Query parameters.
 
         Returns:
-            str: MD5 hash of the serialized parameters.
+            str: BLAKE2b hash of the serialized parameters.
         """
-        param_str = json.dumps(params, sort_keys=True)
-        return hashlib.md5(param_str.encode()).hexdigest()
+        return hashlib.blake2b(_params_key(params), digest_size=16).hexdigest()
 
     def _get_cached_query(self, key):
         """
@@ -163,25 +290,31 @@ class MySQLDatabase:
             cached_result = self.redis_client.get(key)
             if cached_result:
                 module_logger.debug(f"Got Cached Query Result: {cached_result}")
-                return json.loads(cached_result)
+                return self._deserialize_cached_result(cached_result)
             return None
         except redis.RedisError as e:
             module_logger.error(f"Failed to retrieve cached query result: {e}")
             return None
 
-    def _generate_cache_key(self, query, params):
+    def _generate_cache_key(self, query, params, raw=False, fetch_mode="all", fetch_count=None):
         """
-        Generate a unique cache key for a query and its parameters.
+        Generate a unique cache key for a query, its parameters and the shape of its result.
 
         Args:
             query (str): SQL query string.
             params (dict): Query parameters.
+            raw (bool): Whether the key is for positional tuple results.
+            fetch_mode (str): Mode used to fetch the results ('all', 'many', 'one').
+            fetch_count (int, optional): Number of rows fetched in 'many' mode.
 
         Returns:
-            str: MD5 hash representing the cache key.
+            str: BLAKE2b hash representing the cache key.
         """
-        hash_input = f"{query}:{json.dumps(params, sort_keys=True)}"
-        return hashlib.md5(hash_input.encode()).hexdigest()
+        _, prefix = _query_meta(query)
+        hash_input = prefix + _params_key(params) + f"|{fetch_mode}|{fetch_count}".encode()
+        if raw:
+            hash_input += b"|raw"
+        return hashlib.blake2b(hash_input, digest_size=16).hexdigest()
 
     def _invalidate_cache_for_table(self, table_name, params=None):
         """
@@ -192,18 +325,35 @@ class MySQLDatabase:
             params (dict, optional): Query parameters to limit cache invalidation.
         """
 
+        if params:
+            table_key = f"table_cache:{table_name}:{self._generate_param_hash(params)}"
+        else:
+            # Index set holding every cached key and per params set for the table
+            table_key = f"table_cache:{table_name}"
+
         try:
-            if params:
-                param_hash = self._generate_param_hash(params)
-                table_key = f"table_cache:{table_name}:{param_hash}"
-            else:
-                # Invalidate all keys related to the table
-                table_key = f"table_cache:{table_name}:*"
+            cache_keys = None
+            with self.redis_client.pipeline() as pipe:
+                for _ in range(_INVALIDATE_ATTEMPTS):
+                    try:
+                        # WATCH the set so keys added between reading and unlinking abort and retry
+                        pipe.watch(table_key)
+                        cache_keys = pipe.smembers(table_key)
+                        pipe.multi()
+                        if cache_keys:
+                            # UNLINK frees memory in the background instead of blocking Redis like DEL
+                            pipe.unlink(*cache_keys)
+                        pipe.unlink(table_key)
+                        pipe.execute()
+                        break
+                    except redis.WatchError:
+                        continue
+                else:
+                    module_logger.warning(f"Gave up invalidating cache for table {table_name} after "
+                                          f"{_INVALIDATE_ATTEMPTS} concurrent modifications")
+                    return
 
-            cache_keys = self.redis_client.smembers(table_key)
             if cache_keys:
-                self.redis_client.delete(*cache_keys)
-                self.redis_client.delete(table_key)
                 module_logger.info(f"Invalidated cache for table: {table_name} with params: {params}")
 
         except redis.RedisError as e:
@@ -219,54 +369,59 @@ class MySQLDatabase:
         Returns:
             list: Unique list of table names found in the query.
         """
-        tables = []
-
-        # Regex patterns for different SQL statements
-        patterns = {
-            'FROM': r'FROM\s+`?(\w+)`?',
-            'UPDATE': r'UPDATE\s+`?(\w+)`?',
-            'INTO': r'INSERT\s+INTO\s+`?(\w+)`?',
-            'DELETE': r'DELETE\s+FROM\s+`?(\w+)`?'
-        }
-
-        # Check for each pattern in the query
-        for clause, pattern in patterns.items():
-            matches = re.findall(pattern, query, re.IGNORECASE)
-            if matches:
-                tables.extend(matches)
-
-        # Return unique table names
-        return list(set(tables))
+        tables, _ = _query_meta(query)
+        return list(tables)
 
     def _acquire_connection(self):
         """
-        Acquire a new MySQL connection.
+        Acquire a MySQL connection from the pool, waiting up to `pool_timeout` seconds if it is exhausted.
 
         Returns:
-            mysql.connector.connection.MySQLConnection: MySQL connection object.
+            mysql.connector.pooling.PooledMySQLConnection: Pooled MySQL connection object.
 
         Raises:
             mysql.connector.Error: If the connection cannot be established.
         """
-        try:
-            return mysql.connector.connect(**self.dbconfig)
-        except mysql.connector.Error as err:
-            module_logger.error(f"Error acquiring MySQL connection: {err}")
-            raise
+        deadline = time.monotonic() + self.pool_timeout
+        while True:
+            try:
+                return self.pool.get_connection()
+            except mysql.connector.errors.PoolError as err:
+                # get_connection does not block when every connection is in use, so poll until the deadline
+                if time.monotonic() >= deadline:
+                    module_logger.error(f"Error acquiring MySQL connection: {err}")
+                    raise
+                time.sleep(0.05)
+            except mysql.connector.Error as err:
+                module_logger.error(f"Error acquiring MySQL connection: {err}")
+                raise
 
     def _release_connection(self, conn):
         """
-        Release a MySQL connection.
+        Release a MySQL connection back to the pool.
 
         Args:
-            conn (mysql.connector.connection.MySQLConnection): MySQL connection to release.
+            conn (mysql.connector.pooling.PooledMySQLConnection): MySQL connection to release.
         """
         try:
-            if conn.is_connected():
-                conn.close()
-        except mysql.connector.Error as err:
+            conn.close()
+        except Exception as err:
             module_logger.error(f"Error closing connection: {err}")
 
+    def _close_cursor(self, cursor):
+        """
+        Close a cursor so no unread results stay on its connection.
+
+        Args:
+            cursor (mysql.connector.cursor.MySQLCursor): Cursor to close, may be None.
+        """
+        if cursor is None:
+            return
+        try:
+            cursor.close()
+        except mysql.connector.Error as err:
+            module_logger.error(f"Error closing cursor: {err}")
+
     def _convert_value(self, val):
         """
             Convert a value for JSON serialization.
@@ -278,6 +433,10 @@ class MySQLDatabase:
                 JSON-serializable value.
         """
 
+        converter = _CONVERTERS.get(type(val))
+        if converter is not None:
+            return converter(val)
+
         if val is None:
             return None
         if isinstance(val, (str, bool, int, float)):
@@ -286,16 +445,14 @@ class MySQLDatabase:
             return float(val)
         if isinstance(val, datetime.datetime):
             return val.timestamp()
-        if isinstance(val, datetime.date):
+        if isinstance(val, (datetime.date, datetime.time)):
             return val.isoformat()
+        if isinstance(val, datetime.timedelta):
+            return val.total_seconds()
         if isinstance(val, (list, tuple, set)):
             return [self._convert_value(v) for v in val]
         if isinstance(val, dict):
             return {k: self._convert_value(v) for k, v in val.items()}
-        try:
-            return json.loads(val)
-        except (ValueError, TypeError):
-            pass
         try:
             if 'T' in val:
                 return datetime.datetime.fromisoformat(val)
@@ -304,6 +461,34 @@ class MySQLDatabase:
         except (ValueError, TypeError):
             return val
 
+    def _decode_json_columns(self, columns, rows):
+        """
+            Decode JSON values in columns named with a `_json` suffix.
+
+            Args:
+                columns (tuple): Column names of the result set.
+                rows (list): Result rows as tuples.
+
+            Returns:
+                list: Result rows with JSON columns decoded.
+        """
+
+        json_indexes = [index for index, column in enumerate(columns) if column.endswith('_json')]
+        if not json_indexes:
+            return rows
+
+        decoded_rows = []
+        for row in rows:
+            row = list(row)
+            for index in json_indexes:
+                if isinstance(row[index], (str, bytes)):
+                    try:
+                        row[index] = json.loads(row[index])
+                    except ValueError:
+                        pass
+            decoded_rows.append(tuple(row))
+        return decoded_rows
+
     def get_version(self) -> str:
         """
         Get the version of the MySQL server.
@@ -337,55 +522,78 @@ class MySQLDatabase:
         """
         try:
             conn = self._acquire_connection()
-            connected = conn.is_connected()
-            self._release_connection(conn)
-            return connected
+            try:
+                conn.ping(reconnect=False, attempts=1, delay=0)
+                return True
+            finally:
+                self._release_connection(conn)
         except mysql.connector.Error as error:
             module_logger.error(f"<<MySQL>> Connection Check Failed: {error}")
             return False
 
-    def execute_query(self, query: str, params=None, fetch_mode="all", fetch_count=None, multi=False, use_cache=True, cache_ttl=86400):
+    def execute_query(self, query: str, params=None, fetch_mode="all", fetch_count=None, multi=False, use_cache=True, cache_ttl=86400, raw=False):
         """
-        Execute a SQL query and fetch results.
+        Execute a SQL query and fetch results. Columns whose names end in `_json` are decoded from JSON.
         Args:
             query (str): SQL query string.
             params (tuple or dict, optional): Query parameters.
             fetch_mode (str): Mode for fetching results ('all', 'many', 'one').
             fetch_count (int, optional): Number of rows to fetch for 'many' mode.
             multi (bool): Whether to execute multiple statements.
-            use_cache (bool): Whether to use cached results.
+            use_cache (bool): Whether to use cached results. Ignored for SHOW, EXPLAIN, SELECT VERSION() and
+                SELECT LAST_INSERT_ID() queries and queries using NOW(), CURRENT_TIMESTAMP or RAND().
             cache_ttl (int): Time-to-live for the cache entry in seconds.
+            raw (bool): Whether to return rows as positional tuples instead of dictionaries.
         Returns:
             dict: Query execution result with 'success', 'message', and 'result' keys.
         """
-        conn = self._acquire_connection()
-        cursor = conn.cursor(dictionary=True)
         cached_result = None
 
-        # Generate cache key
-        cache_key = self._generate_cache_key(query, params)
+        if use_cache and _NON_CACHEABLE.search(query):
+            use_cache = False
+
+        # Table lookup and cache key prefix are memoized per query string, the key is only built when caching
+        tables, _ = _query_meta(query)
+        cache_key = None
+        if use_cache:
+            cache_key = self._generate_cache_key(query, params, raw, fetch_mode, fetch_count)
 
         if use_cache and not multi:
             cached_result = self._get_cached_query(cache_key)
             if cached_result is not None:
                 module_logger.debug(f"Retrieved cached result for query: {query} | Params: {params}")
-                self._release_connection(conn)
+                if raw:
+                    # JSON turns row tuples into arrays, restore them to match uncached results
+                    if fetch_mode == "one":
+                        cached_result = tuple(cached_result)
+                    else:
+                        cached_result = [tuple(row) for row in cached_result]
                 return {'success': True, 'message': 'MySQL Query Executed Successfully', 'result': cached_result}
 
+        # Only take a pooled connection once the cache has missed
+        conn = self._acquire_connection()
+        # Buffer partial fetches so no unread rows are left on the connection when it returns to the pool
+        cursor = conn.cursor(buffered=fetch_mode != "all")
         try:
             cursor.execute(query, params)
+            columns = cursor.column_names
 
+            # Fetch plain tuples and map column names once instead of building a dict per row in the driver
             if fetch_mode == "all":
-                result = cursor.fetchall()
+                rows = self._decode_json_columns(columns, cursor.fetchall())
+                result = rows if raw else [dict(zip(columns, row)) for row in rows]
             elif fetch_mode == "many":
-                result = cursor.fetchmany(fetch_count) if fetch_count else []
+                rows = self._decode_json_columns(columns, cursor.fetchmany(fetch_count) if fetch_count else [])
+                result = rows if raw else [dict(zip(columns, row)) for row in rows]
             elif fetch_mode == "one":
-                result = cursor.fetchone()
+                row = cursor.fetchone()
+                if row is not None:
+                    row = self._decode_json_columns(columns, [row])[0]
+                result = row if raw or row is None else dict(zip(columns, row))
             else:
                 raise ValueError(f"Invalid fetch_mode: {fetch_mode}")
 
             if use_cache and not cached_result:
-                tables = self._extract_tables_from_query(query)
                 self._cache_query(cache_key, result, tables, params, cache_ttl)
 
             return {'success': True, 'message': 'MySQL Query Executed Successfully', 'result': result}
@@ -396,6 +604,7 @@ class MySQLDatabase:
             module_logger.error(params)
             return {'success': False, 'message': str(error), 'result': []}
         finally:
+            self._close_cursor(cursor)
             self._release_connection(conn)
 
     def execute_commit(self, query: str, params=None, return_row=False, return_count=False, invalidate_tables=True):
@@ -412,6 +621,7 @@ class MySQLDatabase:
         """
 
         conn = self._acquire_connection()
+        cursor = None
         try:
             cursor = conn.cursor(dictionary=True)
             cursor.execute(query, params)
@@ -439,9 +649,10 @@ class MySQLDatabase:
             conn.rollback()
             return {'success': False, 'message': f'MySQL Commit Query Execution Error: {error}', 'result': []}
         finally:
+            self._close_cursor(cursor)
             self._release_connection(conn)
 
-    def execute_many_commit(self, query: str, data: list, batch_size: int = 1000):
+    def execute_many_commit(self, query: str, data: list, batch_size: int = 1000, commit_every: int = 10):
         """
         Execute a batch of write queries in chunks.
 
@@ -449,6 +660,7 @@ class MySQLDatabase:
             query (str): SQL query string.
             data (list): List of parameter tuples for the query.
             batch_size (int): Number of rows to process in each batch.
+            commit_every (int): Number of batches to execute between commits.
 
         Returns:
             dict: Batch execution result with 'success', 'message', and 'result' keys.
@@ -457,22 +669,31 @@ class MySQLDatabase:
             module_logger.warning(f"<<MySQL>> No data provided for batch execution.")
             return {'success': False, 'message': 'No data provided for batch execution.', 'result': []}
 
+        if commit_every < 1:
+            module_logger.warning(f"<<MySQL>> Invalid commit_every for batch execution: {commit_every}")
+            return {'success': False, 'message': 'commit_every must be at least 1.', 'result': []}
+
         conn = self._acquire_connection()
+        cursor = None
+        batch_data = []
         try:
             total_batches = math.ceil(len(data) / batch_size)
-            cursor = conn.cursor(dictionary=True)
+            cursor = conn.cursor()
 
             for batch_num, i in enumerate(range(0, len(data), batch_size), start=1):
                 batch_data = data[i:i + batch_size]
                 cursor.executemany(query, batch_data)
-                conn.commit()
-                module_logger.info(f"<<MySQL>> Batch {batch_num} of {total_batches} Committed Successfully")
+
+                # Commit in groups of batches rather than per batch, and always after the last one
+                if batch_num % commit_every == 0 or batch_num == total_batches:
+                    conn.commit()
+                    module_logger.info(f"<<MySQL>> Batch {batch_num} of {total_batches} Committed Successfully")
 
             return {'success': True, 'message': 'MySQL Multi-Commit Executed Successfully', 'result': []}
         except mysql.connector.Error as error:
             module_logger.error(f"<<MySQL>> <<Multi-Commit>> Error: {error} {query} {batch_data}")
+            conn.rollback()
             return {'success': False, 'message': f'MySQL Multi-Commit Error: {error}', 'result': []}
         finally:
+            self._close_cursor(cursor)
             self._release_connection(conn)
-
-
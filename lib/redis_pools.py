@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# Redis Pools
+
+"""
+Author: Ian Carey
+Date: 2025-1-17
+Description: Process wide Redis connection pools shared between clients using the same logical database.
+
+Usage: In main script import make_pool and pass it to a Redis client
+`client = redis.StrictRedis(connection_pool=make_pool(host, port, password, db))`
+
+Requirements:
+- Python 3.12+
+- redis~=5.2.1
+
+"""
+
+from functools import lru_cache
+
+import redis
+
+
+@lru_cache(maxsize=None)
+def make_pool(host, port, password, db, max_connections=50):
+    """
+    Get the shared Redis connection pool for a server and logical database.
+
+    Pools are cached per argument set, so clients passing the same settings share one pool.
+
+    Args:
+        host (str): Hostname for the Redis server.
+        port (int): Port for the Redis server.
+        password (str): Password for the Redis server.
+        db (int): Redis database number.
+        max_connections (int): Maximum number of connections in the pool.
+
+    Returns:
+        redis.BlockingConnectionPool: Connection pool for the database.
+    """
+    return redis.BlockingConnectionPool(
+        host=host,
+        port=port,
+        password=password,
+        db=db,
+        max_connections=max_connections
+    )
@@ -1,6 +1,6 @@
 import logging
 
-from flask import Blueprint, request, jsonify, flash, redirect, url_for, render_template, current_app, session
+from flask import Blueprint, request, jsonify, flash, redirect, url_for, render_template, current_app, session, g
 
 from lib.user_module import authenticate_user, user_change_password
 from routes.decorators import login_required
@@ -26,6 +26,7 @@ def auth_login():
 @auth.route("/logout")
 def auth_logout():
     session.clear()
+    g.pop('_csrf_token', None)  # The cached CSRF token went with the session
     return redirect(url_for('base_site.base_site_index'))
 
 
@@ -1,62 +1,107 @@
-from functools import wraps
+import hashlib
+import hmac
+import logging
+import threading
+import time
 
 import jwt
-from flask import redirect, url_for, session, request, jsonify, current_app, render_template, flash
+from cachetools import TTLCache
+from flask import redirect, url_for, session, request, jsonify, current_app, render_template, flash, g
 
+module_logger = logging.getLogger('icad_dispatch.decorators')
 
+_CSRF_METHODS = frozenset(('POST', 'PUT', 'DELETE'))
+
+# Reusable decoder with the required claims and accepted algorithms fixed up front
+_JWT = jwt.PyJWT(options={"require": ["exp", "user_id", "ip"]})
+_JWT_ALGORITHMS = ("HS256",)
+
+# Verified JWT payloads keyed by the secret and a hash of the bearer token, so repeat requests skip the signature check
+_jwt_cache = TTLCache(maxsize=4096, ttl=30)
+_jwt_cache_lock = threading.RLock()
+
+
+def _decode_token(bearer, secret_key):
+    # Include the secret so a rotated key never serves payloads verified with the old one
+    token_key = (secret_key, hashlib.sha256(bearer.encode()).digest())
+    with _jwt_cache_lock:
+        cached = _jwt_cache.get(token_key)
+
+    if cached is not None:
+        payload, expires, ip_addresses = cached
+        if expires is not None and expires <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
+        return payload, ip_addresses
+
+    payload = _JWT.decode(bearer, secret_key, algorithms=_JWT_ALGORITHMS)
+
+    ip_addresses = payload.get('ip', [])
+    if isinstance(ip_addresses, list):
+        ip_addresses = frozenset(ip_addresses)
+    else:
+        ip_addresses = frozenset([ip_addresses])  # Handle old tokens with a single IP
+
+    with _jwt_cache_lock:
+        _jwt_cache[token_key] = (payload, payload.get('exp'), ip_addresses)
+    return payload, ip_addresses
+
+
+def _copy_view_name(wrapper, func):
+    # Flask only needs the name for endpoint registration, skip the rest of functools.wraps
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+# Wrappers bind the Flask helpers and proxies as keyword defaults so each call uses fast local lookups
 def csrf_protect(func):
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        if request.method in ['POST', 'PUT', 'DELETE']:
-            token = session.get('_csrf_token', None)
-            if not token or token != request.form.get('_csrf_token'):
-                flash('Form submission failed. Please try again.', 'danger')
-                return redirect(request.referrer or '/')
+    def wrapper(*args, _request=request, _session=session, _g=g, _flash=flash, _redirect=redirect, **kwargs):
+        if _request.method in _CSRF_METHODS:
+            session_token = getattr(_g, '_csrf_token', None) or _session.get('_csrf_token')
+            if session_token:
+                _g._csrf_token = session_token
+            form_token = _request.form.get('_csrf_token')
+            if not session_token or not form_token or not hmac.compare_digest(session_token.encode(), form_token.encode()):
+                _flash('Form submission failed. Please try again.', 'danger')
+                return _redirect(_request.referrer or '/')
         return func(*args, **kwargs)
-    return wrapper
+    return _copy_view_name(wrapper, func)
 
 
 def token_required(f):
-    @wraps(f)
-    def wrapped_function(*args, **kwargs):
-        token = request.headers.get("Authorization")
-        if not token:
-            return jsonify({"message": "Access Denied"}), 401
+    def wrapped_function(*args, _request=request, _jsonify=jsonify, _current_app=current_app, **kwargs):
+        token = _request.headers.get("Authorization")
+        if not token or not token.startswith("Bearer "):
+            return _jsonify({"message": "Access Denied"}), 401
 
         try:
-            secret_key = current_app.config.get('SECRET_KEY')
-            payload = jwt.decode(token.split(" ")[1], secret_key, algorithms=["HS256"])
+            secret_key = _current_app.config['SECRET_KEY']
+            payload, ip_addresses = _decode_token(token[7:], secret_key)
 
             # Validate the user's IP address
-            ip_addresses = payload.get('ip', [])
-            if not isinstance(ip_addresses, list):
-                ip_addresses = [ip_addresses]  # Handle old tokens with a single IP
-
-            if request.remote_addr not in ip_addresses:
-                return jsonify({"message": "Access Denied: IP address mismatch"}), 401
+            if _request.remote_addr not in ip_addresses:
+                return _jsonify({"message": "Access Denied: IP address mismatch"}), 401
 
             kwargs['user_id'] = payload.get('user_id')  # Pass user_id to the route
 
         except jwt.ExpiredSignatureError:
-            return jsonify({"message": "Token has expired"}), 401
+            return _jsonify({"message": "Token has expired"}), 401
         except jwt.InvalidTokenError:
-            return jsonify({"message": "Token is invalid"}), 403
+            return _jsonify({"message": "Token is invalid"}), 403
 
         return f(*args, **kwargs)
 
-    return wrapped_function
+    return _copy_view_name(wrapped_function, f)
 
 
 def login_required(func):
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        authenticated = session.get('authenticated')
-        if not authenticated:
-            current_app.config['logger'].debug(f"Redirecting User: Current session data: {dict(session)}")
-            return redirect(url_for('base_site.base_site_index'))
-        else:
-            current_app.config['logger'].debug(f"User Authorized: Current session data: {dict(session)}")
+    def wrapper(*args, _session=session, _redirect=redirect, _url_for=url_for, **kwargs):
+        if _session.get('authenticated'):
+            return func(*args, **kwargs)
 
-        return func(*args, **kwargs)
+        if module_logger.isEnabledFor(logging.DEBUG):
+            module_logger.debug(f"Redirecting User: Current session data: {dict(_session)}")
+        return _redirect(_url_for('base_site.base_site_index'))
 
-    return wrapper
+    return _copy_view_name(wrapper, func)
@@ -2,7 +2,7 @@
 
 import os
 import base64
-from flask import request, session
+from flask import request, session, g
 
 def log_ip():
     """Logs the IP address of the incoming request."""
@@ -11,10 +11,14 @@ def log_ip():
     main_logger.debug(f"Request received from IP address: {ip_address}")
 
 def generate_csrf_token():
-    """Generates a CSRF token if not already in the session."""
-    if '_csrf_token' not in session:
-        session['_csrf_token'] = base64.urlsafe_b64encode(os.urandom(24)).decode('utf-8')
-    return session['_csrf_token']
+    """Generates a CSRF token if not already in the session and caches it on g for this request."""
+    token = session.get('_csrf_token')
+    if not token:
+        token = base64.urlsafe_b64encode(os.urandom(24)).decode('utf-8')
+        session['_csrf_token'] = token
+    # Always refresh g from the session so a cleared or rotated session never renders a stale token
+    g._csrf_token = token
+    return token
 
 def inject_csrf_token():
     """Injects the CSRF token into the context processor."""